@@ -2,13 +2,30 @@
 A simple Python library for Ryver's REST APIs.
 """
 
+import asyncio
+import collections
+import itertools
+import math
 import requests
+from requests.adapters import HTTPAdapter
 import typing
 import os
 import json
 from abc import ABC, abstractmethod
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from getpass import getpass
+from urllib.parse import quote
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class Creator:
@@ -39,13 +56,21 @@ class Object(ABC):
     Base class for all Ryver objects.
     """
 
+    __slots__ = ("cred", "data", "obj_type", "id")
+
     def __init__(self, cred, obj_type: str, data: dict):
         self.cred = cred
         self.data = data
         self.obj_type = obj_type
-        self.entity_type = ENTITY_TYPES[obj_type]
         self.id = data["id"]
 
+    @property
+    def entity_type(self) -> str:
+        """
+        The entity type of this object (e.g. "Entity.User").
+        """
+        return ENTITY_TYPES[self.obj_type]
+
     def get_id(self) -> typing.Any:
         """
         Get the ID of this object.
@@ -74,6 +99,14 @@ class Message(Object):
     """
     Any generic Ryver message, with an author, body, and reactions.
     """
+
+    __slots__ = ("_reaction_counts",)
+
+    def __init__(self, cred, obj_type: str, data: dict):
+        super().__init__(cred, obj_type, data)
+        # Cached result of get_reaction_counts()
+        self._reaction_counts = None
+
     @abstractmethod
     def get_body(self) -> str:
         """
@@ -113,9 +146,9 @@ class Message(Object):
 
         Note that this method does send requests, so it may take some time.
         """
-        url = self.cred.url_prefix + \
-            f"{self.get_type()}({self.get_id()})/React(reaction='{emoji}')"
-        resp = requests.post(url, headers=self.cred.headers)
+        url = URL_REACT.format(prefix=self.cred.url_prefix, type=self.obj_type,
+                               id=self.id, emoji=quote_odata_str(emoji))
+        resp = self.cred.session.post(url)
         resp.raise_for_status()
 
     def get_reactions(self) -> dict:
@@ -131,11 +164,19 @@ class Message(Object):
         Count the number of reactions for each emoji on a message.
 
         Returns a dict of {emoji: number_of_reacts}
+
+        The counts are only computed once; each call returns a new copy.
         """
-        reactions = self.get_reactions()
-        counts = {reaction: len(users)
-                  for reaction, users in reactions.items()}
-        return counts
+        if self._reaction_counts is None:
+            self._reaction_counts = {reaction: len(users)
+                                     for reaction, users in self.get_reactions().items()}
+        return dict(self._reaction_counts)
+
+    def get_reaction_count(self, emoji: str) -> int:
+        """
+        Get the number of reactions with a specific emoji on this message.
+        """
+        return len(self.get_reactions().get(emoji, ()))
 
 
 class TopicReply(Message):
@@ -143,6 +184,8 @@ class TopicReply(Message):
     A reply on a topic.
     """
 
+    __slots__ = ()
+
     def get_body(self) -> str:
         """
         Get the body of this message.
@@ -171,6 +214,8 @@ class Topic(Message):
     A Ryver topic in a chat.
     """
 
+    __slots__ = ()
+
     def get_subject(self) -> str:
         """
         Get the subject of this topic.
@@ -206,9 +251,9 @@ class Topic(Message):
         }
         if creator:
             data["createSource"] = creator.to_dict()
-        resp = requests.post(url, json=data, headers=self.cred.headers)
+        resp = self.cred.session.post(url, data=json_dumps(data))
         resp.raise_for_status()
-        return TopicReply(self.cred, TYPE_TOPIC_REPLY, resp.json()["d"]["results"])
+        return TopicReply(self.cred, TYPE_TOPIC_REPLY, json_loads(resp.content)["d"]["results"])
 
     def get_replies(self, top: int = -1, skip: int = 0) -> typing.List[TopicReply]:
         """
@@ -219,11 +264,19 @@ class Topic(Message):
 
         Note that this method does send requests, so it may take some time.
         """
-        url = self.cred.url_prefix + TYPE_TOPIC_REPLY + \
-            f"?$format=json&$filter=((post/id eq {self.get_id()}))"
-        replies = get_all(url, self.cred.headers, top=top,
-                          skip=skip, param="&")
-        return [TopicReply(self.cred, TYPE_TOPIC_REPLY, data) for data in replies]
+        return list(self.iter_replies(top=top, skip=skip))
+
+    def iter_replies(self, top: int = -1, skip: int = 0) -> typing.Iterator[TopicReply]:
+        """
+        Like get_replies(), but yields the replies as they are received instead
+        of returning a list.
+
+        Note that this method does send requests, so it may take some time.
+        """
+        url = URL_TOPIC_REPLIES.format(prefix=self.cred.url_prefix, type=TYPE_TOPIC_REPLY,
+                                       id=self.id)
+        for data in iter_all(url, self.cred.session, top=top, skip=skip, param="&"):
+            yield TopicReply(self.cred, TYPE_TOPIC_REPLY, data)
 
 
 class ChatMessage(Message):
@@ -231,6 +284,8 @@ class ChatMessage(Message):
     A Ryver chat message.
     """
 
+    __slots__ = ()
+
     def get_body(self) -> str:
         """
         Get the message body.
@@ -277,29 +332,27 @@ class ChatMessage(Message):
 
         Note that this method does send requests, so it may take some time.
         """
-        url = self.cred.url_prefix + \
-            "{chat_type}({chat_id})/Chat.React()".format(
-                chat_type=get_type_from_entity(self.get_chat_type()), chat_id=self.get_chat_id())
+        url = URL_CHAT_REACT.format(prefix=self.cred.url_prefix, type=get_type_from_entity(
+            self.data["to"]["__metadata"]["type"]), id=self.data["to"]["id"])
         data = {
             "id": self.id,
             "reaction": emoji
         }
 
-        resp = requests.post(url, json=data, headers=self.cred.headers)
+        resp = self.cred.session.post(url, data=json_dumps(data))
         resp.raise_for_status()
 
     def delete(self) -> None:
         """
         Deletes the message.
         """
-        url = self.cred.url_prefix + \
-            "{chat_type}({chat_id})/Chat.DeleteMessage()?%24format=json".format(
-                chat_type=get_type_from_entity(self.get_chat_type()), chat_id=self.get_chat_id())
+        url = URL_CHAT_DELETE_MESSAGE.format(prefix=self.cred.url_prefix, type=get_type_from_entity(
+            self.data["to"]["__metadata"]["type"]), id=self.data["to"]["id"])
         data = {
             "id": self.id,
         }
 
-        resp = requests.post(url, json=data, headers=self.cred.headers)
+        resp = self.cred.session.post(url, data=json_dumps(data))
         resp.raise_for_status()
 
 
@@ -308,6 +361,8 @@ class Chat(Object):
     A Ryver chat (forum, team, user, etc).
     """
 
+    __slots__ = ()
+
     def send_message(self, message: str, creator: Creator = None) -> str:
         """
         Send a message to this chat.
@@ -317,16 +372,16 @@ class Chat(Object):
         Returns the ID of the chat message sent. Note that message IDs are
         strings.
         """
-        url = self.cred.url_prefix + \
-            f"{self.obj_type}({self.id})/Chat.PostMessage()"
+        url = URL_CHAT_POST_MESSAGE.format(prefix=self.cred.url_prefix, type=self.obj_type,
+                                           id=self.id)
         data = {
             "body": message
         }
         if creator:
             data["createSource"] = creator.to_dict()
-        resp = requests.post(url, json=data, headers=self.cred.headers)
+        resp = self.cred.session.post(url, data=json_dumps(data))
         resp.raise_for_status()
-        return resp.json()["d"]["id"]
+        return json_loads(resp.content)["d"]["id"]
 
     def create_topic(self, subject: str, body: str, creator: Creator = None) -> Topic:
         """
@@ -353,9 +408,9 @@ class Chat(Object):
         }
         if creator:
             data["createSource"] = creator.to_dict()
-        resp = requests.post(url, json=data, headers=self.cred.headers)
+        resp = self.cred.session.post(url, data=json_dumps(data))
         resp.raise_for_status()
-        return Topic(self.cred, TYPE_TOPIC, resp.json()["d"]["results"])
+        return Topic(self.cred, TYPE_TOPIC, json_loads(resp.content)["d"]["results"])
 
     def get_topics(self, archived: bool = False, top: int = -1, skip: int = 0) -> typing.List[Topic]:
         """
@@ -366,11 +421,19 @@ class Chat(Object):
 
         Note that this method does send requests, so it may take some time.
         """
-        url = self.cred.url_prefix + \
-            f"{self.obj_type}({self.id})/Post.Stream(archived={'true' if archived else 'false'})?$format=json"
-        topics = get_all(url, self.cred.headers,
-                         param="&", top=top, skip=skip)
-        return [Topic(self.cred, TYPE_TOPIC, data) for data in topics]
+        return list(self.iter_topics(archived=archived, top=top, skip=skip))
+
+    def iter_topics(self, archived: bool = False, top: int = -1, skip: int = 0) -> typing.Iterator[Topic]:
+        """
+        Like get_topics(), but yields the topics as they are received instead
+        of returning a list.
+
+        Note that this method does send requests, so it may take some time.
+        """
+        url = URL_POST_STREAM.format(prefix=self.cred.url_prefix, type=self.obj_type,
+                                     id=self.id, archived="true" if archived else "false")
+        for data in iter_all(url, self.cred.session, param="&", top=top, skip=skip):
+            yield Topic(self.cred, TYPE_TOPIC, data)
 
     def get_messages(self, count: int) -> typing.List[ChatMessage]:
         """
@@ -378,12 +441,38 @@ class Chat(Object):
 
         Note that this method does send requests, so it may take some time.
         """
-        url = self.cred.url_prefix + \
-            f"{self.obj_type}({self.id})/Chat.History()?$format=json&$top={count}"
-        resp = requests.get(url, headers=self.cred.headers)
+        return list(self.iter_messages(count))
+
+    def iter_messages(self, count: int) -> typing.Iterator[ChatMessage]:
+        """
+        Like get_messages(), but yields the messages one by one instead of
+        returning a list.
+
+        Note that this method does send requests, so it may take some time.
+        """
+        url = URL_CHAT_HISTORY.format(prefix=self.cred.url_prefix, type=self.obj_type,
+                                      id=self.id, count=count)
+        resp = self.cred.session.get(url)
         resp.raise_for_status()
-        messages = resp.json()["d"]["results"]
-        return [ChatMessage(self.cred, TYPE_MESSAGE, data) for data in messages]
+        for data in json_loads(resp.content)["d"]["results"]:
+            yield ChatMessage(self.cred, TYPE_MESSAGE, data)
+
+    def get_messages_with_authors(self, count: int) -> typing.List[typing.Tuple[ChatMessage, "User"]]:
+        """
+        Get a number of messages (most recent first) in this chat, along with
+        their authors.
+
+        Returns a list of (message, author) tuples. The authors are all fetched
+        together, which is much faster than calling get_author() on each
+        message.
+
+        Note that this method does send requests, so it may take some time.
+        """
+        messages = self.get_messages(count)
+        authors = self.cred.get_objects(
+            TYPE_USER, {msg.get_author_id() for msg in messages})
+        authors = {author.get_id(): author for author in authors}
+        return [(msg, authors.get(msg.get_author_id())) for msg in messages]
 
 
 class User(Chat):
@@ -391,6 +480,8 @@ class User(Chat):
     A Ryver user.
     """
 
+    __slots__ = ()
+
     def get_username(self) -> str:
         """
         Get the username of this user.
@@ -409,10 +500,11 @@ class User(Chat):
 
         Note that this method does send requests, so it may take some time.
         """
-        url = self.cred.url_prefix + \
-            f"{self.obj_type}({self.id})/User.Active.Set(value='{'true' if activated else 'false'}')"
-        resp = requests.post(url, headers=self.cred.headers)
+        url = URL_USER_ACTIVE_SET.format(prefix=self.cred.url_prefix, type=self.obj_type,
+                                         id=self.id, value="true" if activated else "false")
+        resp = self.cred.session.post(url)
         resp.raise_for_status()
+        self.cred.invalidate_object(self.obj_type, self.id)
 
 
 class GroupChat(Chat):
@@ -420,6 +512,8 @@ class GroupChat(Chat):
     A Ryver team or forum.
     """
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         """
         Get the name of this chat.
@@ -438,18 +532,24 @@ class Forum(GroupChat):
     A Ryver forum.
     """
 
+    __slots__ = ()
+
 
 class Team(GroupChat):
     """
     A Ryver team.
     """
 
+    __slots__ = ()
+
 
 class Notification(Object):
     """
     A Ryver user notification.
     """
 
+    __slots__ = ()
+
     def get_predicate(self) -> str:
         """
         Get the "predicate" of this notification.
@@ -544,17 +644,103 @@ class Ryver:
             "authorization": "Basic " + b64encode((user + ":" + password).encode("ascii")).decode("ascii")
         }
         self.url_prefix = "https://" + org + ".ryver.com/api/1/odata.svc/"
+        # A persistent session keeps connections alive between requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+        # Objects from get_object(), least recently used first
+        self._object_cache = collections.OrderedDict()
+        # Built by get_user_by_username()
+        self._users_by_username = None
+
+    def __enter__(self) -> "Ryver":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session.
+
+        This object should not be used to send any more requests afterwards.
+        """
+        self.session.close()
 
-    def get_object(self, obj_type: str, obj_id: int) -> Object:
+    def get_object(self, obj_type: str, obj_id: int, force_update: bool = False) -> Object:
         """
         Get an object from Ryver with a type and ID.
 
-        Note that this method does send requests, so it may take some time.
+        The last OBJECT_CACHE_SIZE objects retrieved are cached, so getting the
+        same object again does not send another request. Set force_update to
+        True to always request the object from Ryver.
+
+        Note that this method may send requests, so it may take some time.
         """
+        key = (obj_type, obj_id)
+        if not force_update and key in self._object_cache:
+            self._object_cache.move_to_end(key)
+            return self._object_cache[key]
         url = self.url_prefix + f"{obj_type}({obj_id})"
-        resp = requests.get(url, headers=self.headers)
+        resp = self.session.get(url)
         resp.raise_for_status()
-        return TYPES_DICT[obj_type](self, obj_type, resp.json()["d"]["results"])
+        obj = TYPES_DICT[obj_type](self, obj_type, json_loads(resp.content)["d"]["results"])
+        self._cache_object(obj)
+        return obj
+
+    def _cache_object(self, obj: Object) -> None:
+        """
+        Add an object to the get_object() cache, evicting the least recently
+        used object if the cache is full.
+        """
+        key = (obj.obj_type, obj.id)
+        self._object_cache[key] = obj
+        self._object_cache.move_to_end(key)
+        if len(self._object_cache) > OBJECT_CACHE_SIZE:
+            self._object_cache.popitem(last=False)
+
+    def invalidate_object(self, obj_type: str, obj_id: int) -> None:
+        """
+        Remove an object from the get_object() cache, if it is there.
+        """
+        self._object_cache.pop((obj_type, obj_id), None)
+
+    def clear_object_cache(self) -> None:
+        """
+        Remove all objects from the get_object() cache.
+        """
+        self._object_cache.clear()
+
+    def get_objects(self, obj_type: str, obj_ids: typing.Iterable[int], force_update: bool = False) -> typing.List[Object]:
+        """
+        Get multiple objects of the same type from Ryver by their IDs.
+
+        Objects already in the get_object() cache are taken from it unless
+        force_update is True, and the rest are requested in batches of up to
+        PAGE_SIZE IDs per request, to stay well under the URL length limit.
+        The requested objects are added to the cache. The order of the returned
+        objects is not guaranteed, and IDs that do not exist are left out.
+
+        Note that this method may send requests, so it may take some time.
+        """
+        objs = []
+        missing = []
+        for obj_id in dict.fromkeys(obj_ids):
+            key = (obj_type, obj_id)
+            if not force_update and key in self._object_cache:
+                self._object_cache.move_to_end(key)
+                objs.append(self._object_cache[key])
+            else:
+                missing.append(obj_id)
+        for i in range(0, len(missing), PAGE_SIZE):
+            batch = missing[i:i + PAGE_SIZE]
+            url = self.url_prefix + f"{obj_type}?$format=json&$filter=(" + \
+                " or ".join(f"id eq {obj_id}" for obj_id in batch) + ")"
+            for data in get_all(url, self.session, top=len(batch), param="&"):
+                obj = TYPES_DICT[obj_type](self, obj_type, data)
+                self._cache_object(obj)
+                objs.append(obj)
+        return objs
 
     def get_chats(self, obj_type: str, top: int = -1, skip: int = 0) -> typing.List[Chat]:
         """
@@ -566,9 +752,18 @@ class Ryver:
         Note that this method does send requests, so it may take some time.
         Consider using get_cached_chats() to cache the data in a JSON file.
         """
+        return list(self.iter_chats(obj_type, top=top, skip=skip))
+
+    def iter_chats(self, obj_type: str, top: int = -1, skip: int = 0) -> typing.Iterator[Chat]:
+        """
+        Like get_chats(), but yields the chats as they are received instead of
+        returning a list.
+
+        Note that this method does send requests, so it may take some time.
+        """
         url = self.url_prefix + obj_type
-        chats = get_all(url, self.headers, top=top, skip=skip)
-        return [TYPES_DICT[obj_type](self, obj_type, chat) for chat in chats]
+        for chat in iter_all(url, self.session, top=top, skip=skip):
+            yield TYPES_DICT[obj_type](self, obj_type, chat)
 
     def get_cached_chats(self, obj_type: str, force_update: bool = False, name: str = None, top: int = -1, skip: int = 0) -> typing.List[Chat]:
         """
@@ -583,17 +778,38 @@ class Ryver:
         name is not found. You can also force it to perform a request to update
         the lists by setting force_update to True.
         """
-        name = name or "pyryver." + obj_type + ".json"
+        default_name = "pyryver." + obj_type + ".json"
+        name = name or default_name
         if not force_update and os.path.exists(name):
-            with open(name, "r") as f:
-                data = json.load(f)
-                return [TYPES_DICT[obj_type](self, obj_type, chat) for chat in data]
+            with open(name, "rb") as f:
+                data = json_loads(f.read())
+            return [TYPES_DICT[obj_type](self, obj_type, chat) for chat in data]
         else:
             chats = self.get_chats(obj_type, top=top, skip=skip)
-            with open(name, "w") as f:
-                json.dump([chat.data for chat in chats], f)
+            data = json_dumps([chat.data for chat in chats])
+            # Write to a temporary file first so a crash can't leave a broken cache
+            with open(name + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(name + ".tmp", name)
+            # Keep get_user_by_username() in sync with the default users file
+            if obj_type == TYPE_USER and name == default_name:
+                self._users_by_username = index_by(chats, FIELD_USER_USERNAME)
             return chats
 
+    def get_user_by_username(self, username: str) -> User:
+        """
+        Get a user by their username, or None if not found.
+
+        The users are loaded with get_cached_chats() and indexed the first
+        time this is called, so the first call may send requests and write
+        pyryver.users.json to the working directory. The index is rebuilt
+        whenever get_cached_chats() updates that file.
+        """
+        if self._users_by_username is None:
+            self._users_by_username = index_by(
+                self.get_cached_chats(TYPE_USER), FIELD_USER_USERNAME)
+        return self._users_by_username.get(username)
+
     def get_notifs(self, unread: bool = False, top: int = -1, skip: int = 0) -> typing.List[Notification]:
         """
         Get all the user's notifications. 
@@ -603,14 +819,23 @@ class Ryver:
         top is the maximum number of results (-1 for unlimited), skip is how
         many results to skip.
 
+        Note that this method does send requests, so it may take some time.
+        """
+        return list(self.iter_notifs(unread=unread, top=top, skip=skip))
+
+    def iter_notifs(self, unread: bool = False, top: int = -1, skip: int = 0) -> typing.Iterator[Notification]:
+        """
+        Like get_notifs(), but yields the notifications as they are received
+        instead of returning a list.
+
         Note that this method does send requests, so it may take some time.
         """
         url = self.url_prefix + TYPE_NOTIFICATION + \
             "?$format=json&$orderby=modifyDate desc"
         if unread:
             url += "&$filter=((unread eq true))"
-        notifs = get_all(url, self.headers, top=top, skip=skip, param="&")
-        return [Notification(self, TYPE_NOTIFICATION, data) for data in notifs]
+        for data in iter_all(url, self.session, top=top, skip=skip, param="&"):
+            yield Notification(self, TYPE_NOTIFICATION, data)
 
     def mark_all_notifs_read(self) -> int:
         """
@@ -622,9 +847,9 @@ class Ryver:
         """
         url = self.url_prefix + TYPE_NOTIFICATION + \
             "/UserNotification.MarkAllRead()?$format=json"
-        resp = requests.post(url, headers=self.headers)
+        resp = self.session.post(url)
         resp.raise_for_status()
-        return resp.json()["d"]["count"]
+        return json_loads(resp.content)["d"]["count"]
 
     def mark_all_notifs_seen(self) -> int:
         """
@@ -636,9 +861,177 @@ class Ryver:
         """
         url = self.url_prefix + TYPE_NOTIFICATION + \
             "/UserNotification.MarkAllSeen()?$format=json"
-        resp = requests.post(url, headers=self.headers)
+        resp = self.session.post(url)
         resp.raise_for_status()
-        return resp.json()["d"]["count"]
+        return json_loads(resp.content)["d"]["count"]
+
+
+class AsyncRyver:
+    """
+    An asyncio version of the Ryver object, for sending many requests
+    concurrently. Requires the aiohttp library.
+
+    This wraps a regular Ryver object, which is created from org, user and
+    password if not provided. The objects returned are regular pyryver
+    objects using that Ryver object as their credentials.
+
+    At most max_concurrency requests are sent at the same time. Requests that
+    fail with HTTP 429 or a server error are retried with exponential back-off.
+
+    The aiohttp session is created when the first request is sent; close it
+    with close(), or use this object as an async context manager. This also
+    closes the Ryver object if it was not provided.
+    """
+
+    def __init__(self, ryver: Ryver = None, org: str = None, user: str = None, password: str = None,
+                 max_concurrency: int = 64, max_retries: int = 5):
+        if aiohttp is None:
+            raise ImportError("AsyncRyver requires the aiohttp library")
+        # Only close the Ryver object if it was created here
+        self._owns_ryver = ryver is None
+        self.ryver = ryver or Ryver(org, user, password)
+        self.headers = self.ryver.headers
+        self.url_prefix = self.ryver.url_prefix
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.session = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> "AsyncRyver":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the underlying aiohttp session, if it has been created.
+
+        If the wrapped Ryver object was created by this object, it is closed
+        as well.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self._owns_ryver:
+            self.ryver.close()
+
+    async def request(self, method: str, url: str, data: dict = None) -> typing.Any:
+        """
+        Send a request and return the parsed JSON response.
+
+        Intended for internal use only.
+        """
+        # Created here because both have to be made inside the event loop
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.max_concurrency), headers=self.headers)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Serialize once up front instead of on every retry
+        body = json_dumps(data) if data is not None else None
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                async with self.session.request(method, url, data=body) as resp:
+                    if (resp.status != 429 and resp.status < 500) or attempt == self.max_retries:
+                        resp.raise_for_status()
+                        return await resp.json(loads=json_loads, content_type=None)
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    async def get_all(self, url: str, top: int = -1, skip: int = 0, param: str = "?") -> typing.List[dict]:
+        """
+        The async version of get_all().
+
+        Pages are requested MAX_WORKERS at a time until a page that is not
+        full is received, or top results have been requested.
+
+        Intended for internal use only.
+        """
+        async def fetch_page(page_skip: int, count: int) -> typing.List[dict]:
+            resp = await self.request("GET", url + f"{param}$skip={page_skip}&$top={count}")
+            return resp["d"]["results"]
+
+        # -1 means everything
+        remaining = float("inf") if top == -1 else top
+        result = []
+        while remaining > 0:
+            counts = [min(PAGE_SIZE, remaining - PAGE_SIZE * i) for i in range(MAX_WORKERS)
+                      if remaining > PAGE_SIZE * i]
+            pages = await asyncio.gather(*[fetch_page(skip + PAGE_SIZE * i, count)
+                                           for i, count in enumerate(counts)])
+            for page, count in zip(pages, counts):
+                result.extend(page)
+                if len(page) < count:
+                    return result
+            skip += sum(counts)
+            remaining -= sum(counts)
+        return result
+
+    async def get_object(self, obj_type: str, obj_id: int) -> Object:
+        """
+        The async version of Ryver.get_object().
+        """
+        url = self.url_prefix + f"{obj_type}({obj_id})"
+        resp = await self.request("GET", url)
+        return TYPES_DICT[obj_type](self.ryver, obj_type, resp["d"]["results"])
+
+    async def get_chats(self, obj_type: str, top: int = -1, skip: int = 0) -> typing.List[Chat]:
+        """
+        The async version of Ryver.get_chats().
+        """
+        url = self.url_prefix + obj_type
+        chats = await self.get_all(url, top=top, skip=skip)
+        return [TYPES_DICT[obj_type](self.ryver, obj_type, chat) for chat in chats]
+
+    async def get_notifs(self, unread: bool = False, top: int = -1, skip: int = 0) -> typing.List[Notification]:
+        """
+        The async version of Ryver.get_notifs().
+        """
+        url = self.url_prefix + TYPE_NOTIFICATION + \
+            "?$format=json&$orderby=modifyDate desc"
+        if unread:
+            url += "&$filter=((unread eq true))"
+        notifs = await self.get_all(url, top=top, skip=skip, param="&")
+        return [Notification(self.ryver, TYPE_NOTIFICATION, data) for data in notifs]
+
+    async def send_message(self, chat: Chat, message: str, creator: Creator = None) -> str:
+        """
+        The async version of Chat.send_message().
+        """
+        url = URL_CHAT_POST_MESSAGE.format(prefix=self.url_prefix, type=chat.obj_type,
+                                           id=chat.id)
+        data = {
+            "body": message
+        }
+        if creator:
+            data["createSource"] = creator.to_dict()
+        resp = await self.request("POST", url, data)
+        return resp["d"]["id"]
+
+    async def react(self, message: Message, emoji: str) -> None:
+        """
+        The async version of Message.react() and ChatMessage.react().
+        """
+        if isinstance(message, ChatMessage):
+            url = URL_CHAT_REACT.format(prefix=self.url_prefix, type=get_type_from_entity(
+                message.get_chat_type()), id=message.get_chat_id())
+            data = {
+                "id": message.id,
+                "reaction": emoji
+            }
+            await self.request("POST", url, data)
+        else:
+            url = URL_REACT.format(prefix=self.url_prefix, type=message.obj_type,
+                                   id=message.id, emoji=quote_odata_str(emoji))
+            await self.request("POST", url)
+
+    async def get_replies(self, topic: Topic, top: int = -1, skip: int = 0) -> typing.List[TopicReply]:
+        """
+        The async version of Topic.get_replies().
+        """
+        url = URL_TOPIC_REPLIES.format(prefix=self.url_prefix, type=TYPE_TOPIC_REPLY,
+                                       id=topic.id)
+        replies = await self.get_all(url, top=top, skip=skip, param="&")
+        return [TopicReply(self.ryver, TYPE_TOPIC_REPLY, data) for data in replies]
 
 
 TYPE_USER = "users"
@@ -663,6 +1056,8 @@ ENTITY_TYPES = {
     TYPE_NOTIFICATION: "Entity.UserNotification",
 }
 
+ENTITY_TYPES_REV = {entity: t for t, entity in ENTITY_TYPES.items()}
+
 TYPES_DICT = {
     TYPE_USER: User,
     TYPE_FORUM: Forum,
@@ -685,6 +1080,26 @@ NOTIF_PREDICATE_MENTION = "chat_mention"
 NOTIF_PREDICATE_GROUP_MENTION = "group_mention"
 NOTIF_PREDICATE_COMMENT = "commented_on"
 
+# URL templates for the API actions, formatted with the URL prefix and the
+# type and ID of the object the action is performed on
+URL_REACT = "{prefix}{type}({id})/React(reaction='{emoji}')"
+URL_TOPIC_REPLIES = "{prefix}{type}?$format=json&$filter=((post/id eq {id}))"
+URL_CHAT_REACT = "{prefix}{type}({id})/Chat.React()"
+URL_CHAT_DELETE_MESSAGE = "{prefix}{type}({id})/Chat.DeleteMessage()?%24format=json"
+URL_CHAT_POST_MESSAGE = "{prefix}{type}({id})/Chat.PostMessage()"
+URL_CHAT_HISTORY = "{prefix}{type}({id})/Chat.History()?$format=json&$top={count}"
+URL_POST_STREAM = "{prefix}{type}({id})/Post.Stream(archived={archived})?$format=json"
+URL_USER_ACTIVE_SET = "{prefix}{type}({id})/User.Active.Set(value='{value}')"
+
+# The REST API only gives this many results at a time
+PAGE_SIZE = 50
+# Maximum number of pages requested concurrently by get_all()
+MAX_WORKERS = 8
+# Base delay in seconds before AsyncRyver retries a failed request
+RETRY_BACKOFF = 0.5
+# Maximum number of objects cached by Ryver.get_object()
+OBJECT_CACHE_SIZE = 1024
+
 
 def get_obj_by_field(objs: typing.List[Object], field: str, value: typing.Any) -> Object:
     """
@@ -692,6 +1107,9 @@ def get_obj_by_field(objs: typing.List[Object], field: str, value: typing.Any) -
 
     For example, this function can find a chat with a specific nickname in a
     list of chats.
+
+    This searches the whole list every time; for repeated lookups, pre-build
+    an index with index_by() instead.
     """
     for obj in objs:
         if obj.data[field] == value:
@@ -699,39 +1117,150 @@ def get_obj_by_field(objs: typing.List[Object], field: str, value: typing.Any) -
     return None
 
 
-def get_all(url: str, headers: dict, top: int = -1, skip: int = 0, param: str = "?") -> typing.List[dict]:
+def index_by(objs: typing.Iterable[Object], field: str) -> typing.Dict[typing.Any, Object]:
+    """
+    Build a dict of {value: obj} from a list of objects by a field.
+
+    For example, index_by(users, FIELD_USER_USERNAME) maps usernames to users.
+    If multiple objects have the same value, the last one is kept.
+    """
+    return {obj.data[field]: obj for obj in objs}
+
+
+def quote_odata_str(value: str) -> str:
+    """
+    Escape a value to be put inside a quoted OData string literal in a URL.
+
+    Single quotes are doubled as required by OData, then the result is
+    percent-encoded.
+
+    Intended for internal use only.
+    """
+    return quote(value.replace("'", "''"), safe="")
+
+
+def json_loads(data: typing.Union[bytes, str]) -> typing.Any:
+    """
+    Parse JSON, using orjson if it is available.
+
+    Intended for internal use only.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: typing.Any) -> bytes:
+    """
+    Serialize an object to JSON bytes, using orjson if it is available.
+
+    Intended for internal use only.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def get_all(url: str, session: requests.Session, top: int = -1, skip: int = 0, param: str = "?") -> typing.List[dict]:
     """
     Because the REST API only gives 50 results at a time, this function is used
     to retrieve all objects.
 
+    Pages are requested concurrently, with at most MAX_WORKERS in flight at a
+    time; see iter_all() for details.
+
     Intended for internal use only.
     """
-    # -1 means everything
-    if top == -1:
-        top = float("inf")
-    result = []
-    while True:
-        # Respect the max specified
-        count = min(top, 50)
-        top -= count
+    return list(iter_all(url, session, top=top, skip=skip, param=param))
+
 
-        resp = requests.get(
-            url + f"{param}$skip={skip}&$top={count}", headers=headers)
+def iter_all(url: str, session: requests.Session, top: int = -1, skip: int = 0, param: str = "?") -> typing.Iterator[dict]:
+    """
+    Like get_all(), but yields the objects page by page instead of returning
+    a list.
+
+    If top is not specified, the first request also asks for the total number
+    of results, so the rest of the pages can be requested concurrently. If the
+    server rejects this or doesn't return the total, the pages are requested
+    one at a time instead. Results added beyond the total are still read, one
+    page at a time, until an empty page is received.
+
+    Pages are only fetched up to MAX_WORKERS ahead of the one being consumed,
+    so memory use does not grow with the number of results.
+
+    Intended for internal use only.
+    """
+    def fetch_page(page: typing.Tuple[int, int]) -> typing.List[dict]:
+        page_skip, count = page
+        resp = session.get(url + f"{param}$skip={page_skip}&$top={count}")
         resp.raise_for_status()
-        page = resp.json()["d"]["results"]
-        result.extend(page)
-        if len(page) == 0 or top == 0:
+        return json_loads(resp.content)["d"]["results"]
+
+    # The page offsets are all known in advance, so fetch them in parallel
+    if top != -1:
+        pages = [(skip + PAGE_SIZE * i, min(PAGE_SIZE, top - PAGE_SIZE * i))
+                 for i in range(math.ceil(top / PAGE_SIZE))]
+        if not pages:
+            return
+        # Don't bother starting threads for a single request
+        if len(pages) == 1:
+            yield from fetch_page(pages[0])
+            return
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pages))) as executor:
+            pages = iter(pages)
+            # Keep at most MAX_WORKERS pages in flight, topping up as they are consumed
+            pending = collections.deque((page[1], executor.submit(fetch_page, page))
+                                        for page in itertools.islice(pages, MAX_WORKERS))
+            try:
+                while pending:
+                    count, future = pending.popleft()
+                    page = future.result()
+                    # A page that isn't full means there are no more results
+                    if len(page) < count:
+                        yield from page
+                        return
+                    for next_page in itertools.islice(pages, 1):
+                        pending.append((next_page[1], executor.submit(fetch_page, next_page)))
+                    yield from page
+            finally:
+                # Don't wait for pages that will never be consumed
+                for _, future in pending:
+                    future.cancel()
+        return
+
+    # -1 means everything
+    resp = session.get(url + f"{param}$skip={skip}&$top={PAGE_SIZE}&$inlinecount=allpages")
+    if 400 <= resp.status_code < 500:
+        # $inlinecount isn't supported, so page through without the total
+        resp = session.get(url + f"{param}$skip={skip}&$top={PAGE_SIZE}")
+    resp.raise_for_status()
+    first = json_loads(resp.content)["d"]
+    page = first["results"]
+    yield from page
+    if len(page) == 0:
+        return
+    skip += len(page)
+    # With the total known, the rest of the pages can be fetched in parallel
+    if "__count" in first:
+        remaining = int(first["__count"]) - skip
+        if remaining > 0:
+            yield from iter_all(url, session, top=remaining, skip=skip, param=param)
+            skip += remaining
+
+    # Read the rest (or anything added after the total was counted) sequentially
+    while True:
+        page = fetch_page((skip, PAGE_SIZE))
+        yield from page
+        if len(page) == 0:
             break
         skip += len(page)
-    return result
 
 
 def get_type_from_entity(entity_type: str) -> str:
     """
     Gets the object type from the entity type
 
-    Note that it doesn't actually return a class, just the string
+    Note that it doesn't actually return a class, just the string.
+    Returns None if the entity type is unknown.
     """
-    for t, e in ENTITY_TYPES.items():
-        if e == entity_type:
-            return t
+    return ENTITY_TYPES_REV.get(entity_type)